@@ -21,6 +21,7 @@ import (
 	"golang.org/x/crypto/argon2"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials"
+	"google.golang.org/grpc/keepalive"
 )
 
 type authServer struct {
@@ -426,6 +427,10 @@ func main() {
 
 	opts := []grpc.ServerOption{
 		grpc.Creds(credentials.NewTLS(tlsConfig)),
+		grpc.KeepaliveParams(keepalive.ServerParameters{
+			Time:    60 * time.Second, // ping idle connections every minute
+			Timeout: 20 * time.Second, // drop the connection if the ping isn't acked
+		}),
 	}
 	grpcServer := grpc.NewServer(opts...)
 	pb.RegisterAuthenticationServiceServer(grpcServer, &authServer{db: db, jwtSecret: jwtSecret})
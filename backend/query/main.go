@@ -10,12 +10,14 @@ import (
 	"net/http"
 	"os"
 	"strings"
+	"time"
 
 	pb "github.com/cc-0000/indeq/common/api"
 	"github.com/cc-0000/indeq/common/config"
 	amqp "github.com/rabbitmq/amqp091-go"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials"
+	"google.golang.org/grpc/keepalive"
 )
 
 type queryServer struct {
@@ -170,6 +172,10 @@ func main() {
 	// Launch the server on the listener
 	opts := []grpc.ServerOption{
 		grpc.Creds(credentials.NewTLS(tlsConfig)),
+		grpc.KeepaliveParams(keepalive.ServerParameters{
+			Time:    60 * time.Second, // ping idle connections every minute
+			Timeout: 20 * time.Second, // drop the connection if the ping isn't acked
+		}),
 	}
 	grpcServer := grpc.NewServer(opts...)
 	pb.RegisterQueryServiceServer(grpcServer, &queryServer{rabbitMQConn: rabbitMQConn})
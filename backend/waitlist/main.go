@@ -13,6 +13,7 @@ import (
 	_ "github.com/lib/pq"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials"
+	"google.golang.org/grpc/keepalive"
 	"github.com/cc-0000/indeq/common/config"
 )
 
@@ -127,6 +128,10 @@ func main() {
 
 	opts := []grpc.ServerOption{
 		grpc.Creds(credentials.NewTLS(tlsConfig)),
+		grpc.KeepaliveParams(keepalive.ServerParameters{
+			Time:    60 * time.Second, // ping idle connections every minute
+			Timeout: 20 * time.Second, // drop the connection if the ping isn't acked
+		}),
 	}
 	grpcServer := grpc.NewServer(opts...)
 	pb.RegisterWaitlistServiceServer(grpcServer, &WaitlistServer{db: db})